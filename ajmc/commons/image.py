@@ -18,6 +18,19 @@ from ajmc.ocr.data_processing.data_generation import draw_textline
 logger = get_ajmc_logger(__name__)
 
 
+def read_image(path: str) -> np.ndarray:
+    """Reads and decodes the image at ``path`` to a BGR matrix.
+
+    Raises:
+        FileNotFoundError: If ``path`` does not exist.
+        ValueError: If the file at ``path`` cannot be decoded as an image.
+    """
+    matrix = cv2.imdecode(np.fromfile(path, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if matrix is None:
+        raise ValueError(f'Could not decode the image at {path}.')
+    return matrix
+
+
 class AjmcImage:
     """Default class for ajmc images.
 
@@ -46,7 +59,7 @@ class AjmcImage:
     @lazy_property
     def matrix(self) -> np.ndarray:
         """np.ndarray of the image image matrix. Its shape is (height, width, channels)."""
-        return cv2.imread(str(self.path))
+        return read_image(str(self.path))
 
     @lazy_property
     def height(self) -> int:
@@ -60,10 +73,27 @@ class AjmcImage:
     def contours(self):
         return find_contours(self.matrix)
 
+    def crop_view(self,
+                  box: variables.BoxType,
+                  margin: int = 0) -> np.ndarray:
+        """Gets the slice of ``self.matrix`` corresponding to ``box``.
+
+        Warning:
+            The returned array is a view and shares its buffer with ``self.matrix``: writing to it modifies ``self``.
+
+        Args:
+            box: The bbox delimiting the desired crop
+            margin: The extra margin desired around ``box``
+
+        Returns:
+             A view on the desired crop.
+        """
+        return self.matrix[box[0][1] - margin:box[1][1] + margin, box[0][0] - margin:box[1][0] + margin]
+
     def crop(self,
              box: variables.BoxType,
              margin: int = 0) -> 'AjmcImage':
-        """Gets the slice of ``self.matrix`` corresponding to ``box``.
+        """Wraps ``self.crop_view`` in a new ``AjmcImage``.
 
         Args:
             box: The bbox delimiting the desired crop
@@ -72,9 +102,7 @@ class AjmcImage:
         Returns:
              A new ``AjmcImage`` containing the desired crop.
         """
-        cropped = self.matrix[box[0][1] - margin:box[1][1] + margin, box[0][0] - margin:box[1][0] + margin, :]
-
-        return AjmcImage(matrix=cropped)
+        return AjmcImage(matrix=self.crop_view(box, margin))
 
     def write(self, output_path: Path):
         cv2.imwrite(str(output_path), self.matrix)
@@ -85,12 +113,18 @@ class AjmcImage:
         cv2.destroyAllWindows()
 
 
+def to_grayscale(img_matrix: np.ndarray) -> np.ndarray:
+    """Converts a BGR ``img_matrix`` to grayscale, returning it untouched if it already has a single channel."""
+    if img_matrix.ndim == 2 or img_matrix.shape[2] == 1:
+        return img_matrix
+    return cv2.cvtColor(img_matrix, cv2.COLOR_BGR2GRAY)
+
+
 def binarize(img_matrix: np.ndarray,
              inverted: bool = False):
     """Binarizes an ``img_matrix`` using cv2 and Otsu's method."""
     binarization_type = (cv2.THRESH_OTSU | cv2.THRESH_BINARY_INV) if inverted else (cv2.THRESH_OTSU | cv2.THRESH_BINARY)
-    gray = cv2.cvtColor(img_matrix, cv2.COLOR_BGR2GRAY)
-    return cv2.threshold(gray, 0, 255, type=binarization_type)[1]
+    return cv2.threshold(to_grayscale(img_matrix), 0, 255, type=binarization_type)[1]
 
 
 def binarize_image_dir(img_dir: Path, glob_pattern: str = '*.png', inverted: bool = False):
@@ -133,39 +167,25 @@ def draw_box(box: variables.BoxType,
 
     """
 
+    stroke_color = rgb_to_bgr(stroke_color)
+    fill_color = rgb_to_bgr(fill_color) if fill_color is not None else None
+
     if fill_color is not None:
-        sub_img_matrix = img_matrix[box[0][1]:box[1][1] + 1, box[0][0]:box[1][0] + 1]  # Creates the sub-image
-        box_fill = sub_img_matrix.copy()  # Creates the fill to be added
-        box_fill[:] = rgb_to_bgr(fill_color)  # Fills the fill with the desired color
-        img_matrix[box[0][1]:box[1][1] + 1, box[0][0]:box[1][0] + 1] = cv2.addWeighted(src1=sub_img_matrix,
-                                                                                       # Adds the fill to the image
-                                                                                       alpha=1 - fill_opacity,
-                                                                                       src2=box_fill,
-                                                                                       beta=fill_opacity,
-                                                                                       gamma=0)
+        sub_img_matrix = img_matrix[box[0][1]:box[1][1] + 1, box[0][0]:box[1][0] + 1]  # A view on the sub-image
+        # Blends the fill into the sub-image in place, writing directly into ``img_matrix``
+        cv2.addWeighted(src1=sub_img_matrix,
+                        alpha=1 - fill_opacity,
+                        src2=np.full_like(sub_img_matrix, fill_color),
+                        beta=fill_opacity,
+                        gamma=0,
+                        dst=sub_img_matrix)
 
     img_matrix = cv2.rectangle(img_matrix, pt1=box[0], pt2=box[1],
-                               color=rgb_to_bgr(stroke_color),
+                               color=stroke_color,
                                thickness=stroke_thickness)
 
     if text is not None:
-        try:
-            text_img = draw_textline(text,
-                                     fonts=font_utils.get_default_fonts(),
-                                     fallback_fonts=font_utils.get_fallback_fonts(),
-                                     target_height=max((box[1][1] - box[0][1]) // 3, 10),
-                                     raise_if_unprintable_char=False)
-
-            # Convert the pillow image to a numpy array
-            text_img = np.array(text_img)
-            # Colorize the text image (it is black by default)
-            text_img = cv2.cvtColor(text_img, cv2.COLOR_GRAY2BGR)
-
-            # Include the image in the original image
-            img_matrix[box[0][1] - text_img.shape[0]:box[0][1], box[1][0] - text_img.shape[1]: box[1][0]:] = text_img
-        except Exception as e:
-            print(f'Error: {e}')
-            pass
+        img_matrix = draw_box_label(box=box, img_matrix=img_matrix, text=text)
 
         # Start by getting the actual size of the text_box
         # (text_width, text_height), _ = cv2.getTextSize(text, fontFace=cv2.FONT_HERSHEY_TRIPLEX,
@@ -189,11 +209,104 @@ def draw_box(box: variables.BoxType,
     return img_matrix
 
 
+def draw_box_label(box: variables.BoxType,
+                   img_matrix: np.ndarray,
+                   text: str) -> np.ndarray:
+    """Writes ``text`` above the upper right corner of ``box`` on ``img_matrix``.
+
+    Returns:
+        np.ndarray: The modified ``img_matrix``
+    """
+    try:
+        text_img = draw_textline(text,
+                                 fonts=font_utils.get_default_fonts(),
+                                 fallback_fonts=font_utils.get_fallback_fonts(),
+                                 target_height=max((box[1][1] - box[0][1]) // 3, 10),
+                                 raise_if_unprintable_char=False)
+
+        # Convert the pillow image to a numpy array
+        text_img = np.array(text_img)
+        # Colorize the text image (it is black by default)
+        text_img = cv2.cvtColor(text_img, cv2.COLOR_GRAY2BGR)
+
+        # Include the image in the original image
+        img_matrix[box[0][1] - text_img.shape[0]:box[0][1], box[1][0] - text_img.shape[1]: box[1][0]:] = text_img
+    except Exception as e:
+        print(f'Error: {e}')
+        pass
+
+    return img_matrix
+
+
+def draw_boxes(boxes: List[variables.BoxType],
+               img_matrix: np.ndarray,
+               color: Tuple[int, int, int],
+               stroke_thickness: int = 1,
+               fill_opacity: Optional[float] = None) -> np.ndarray:
+    """Draws several boxes sharing the same style on ``img_matrix``, in place.
+
+    Note:
+        Fills are blended box by box on views of ``img_matrix``, exactly like ``draw_box``, but contours are drawn
+        with a single ``cv2.polylines`` call.
+
+    Args:
+        boxes: The bboxes to draw.
+        img_matrix: The image matrix on which to draw the boxes.
+        color: The color of the boxes' contours and fills, in BGR.
+        stroke_thickness: The thickness of the boxes' contours.
+        fill_opacity: The opacity of the boxes' fills. Leave ``None`` to draw contours only.
+
+    Returns:
+        np.ndarray: The modified ``img_matrix``
+    """
+    if fill_opacity:
+        for box in boxes:
+            sub_img_matrix = img_matrix[box[0][1]:box[1][1] + 1, box[0][0]:box[1][0] + 1]  # A view on the sub-image
+            # Blends the fill into the sub-image in place, as ``draw_box`` does
+            cv2.addWeighted(src1=sub_img_matrix,
+                            alpha=1 - fill_opacity,
+                            src2=np.full_like(sub_img_matrix, color),
+                            beta=fill_opacity,
+                            gamma=0,
+                            dst=sub_img_matrix)
+
+    # Converts ((x0, y0), (x1, y1)) boxes to their four corners
+    x0, y0, x1, y1 = np.array(boxes, dtype=np.int32).reshape(-1, 4).T
+    corners = np.stack([x0, y0, x1, y0, x1, y1, x0, y1], axis=1).reshape(-1, 4, 2)
+
+    return cv2.polylines(img_matrix, pts=list(corners), isClosed=True, color=color, thickness=stroke_thickness)
+
+
+def _get_region_style_and_boxes(tc) -> Tuple[tuple, List[variables.BoxType]]:
+    return (variables.REGION_TYPES_TO_BGR[tc.region_type], 2, .3), [tc.bbox.bbox]
+
+
+def _get_annotation_style_and_boxes(tc) -> Tuple[tuple, List[variables.BoxType]]:
+    return (variables.TEXTCONTAINERS_TYPES_TO_BGR[tc.type], 2, .3), [bbox.bbox for bbox in tc.bboxes]
+
+
+def _get_default_style_and_boxes(tc) -> Tuple[tuple, List[variables.BoxType]]:
+    return (variables.TEXTCONTAINERS_TYPES_TO_BGR[tc.type], 1, .2), [tc.bbox.bbox]
+
+
+# Maps textcontainer types to functions returning their ``(color, stroke_thickness, fill_opacity)`` style and bboxes
+_TC_TYPES_TO_STYLE_GETTERS = {'region': _get_region_style_and_boxes,
+                              'entity': _get_annotation_style_and_boxes,
+                              'sentence': _get_annotation_style_and_boxes,
+                              'hyphenation': _get_annotation_style_and_boxes,
+                              'lemma': _get_annotation_style_and_boxes}
+
+
 def draw_textcontainers(img_matrix: np.ndarray,
                         output_path: Optional[Union[str, Path]] = None,
                         text_getter: Optional[Callable] = None,
                         *textcontainers, ):
-    """Draws a list of ``TextContainer``s on ``img_matrix``."""
+    """Draws a list of ``TextContainer``s on ``img_matrix``.
+
+    Note:
+        Textcontainers are grouped by style, and each group is drawn at once with ``draw_boxes``. Labels are written
+        last, so that they are not covered by other boxes.
+    """
 
     def _text_getter(tc):
         if text_getter is None:
@@ -206,46 +319,22 @@ def draw_textcontainers(img_matrix: np.ndarray,
         else:
             return text_getter(tc)
 
-    # Get the set of textcontainer types
-    for tc in textcontainers:
-        if tc.type == 'region':
-            img_matrix = draw_box(box=tc.bbox.bbox,
-                                  img_matrix=img_matrix,
-                                  stroke_color=variables.REGION_TYPES_TO_COLORS[tc.region_type],
-                                  stroke_thickness=2,
-                                  fill_color=variables.REGION_TYPES_TO_COLORS[tc.region_type],
-                                  fill_opacity=.3,
-                                  text=_text_getter(tc))
-
-        elif tc.type in ['entity', 'sentence', 'hyphenation', 'lemma']:
-            for i, bbox in enumerate(tc.bboxes):
-                if i == len(
-                        tc.bboxes) - 1:  # We write the region label text only if it's the last bbox to avoid overlap
-                    img_matrix = draw_box(box=bbox.bbox,
-                                          img_matrix=img_matrix,
-                                          stroke_color=variables.TEXTCONTAINERS_TYPES_TO_COLORS[tc.type],
-                                          stroke_thickness=2,
-                                          fill_color=variables.TEXTCONTAINERS_TYPES_TO_COLORS[tc.type],
-                                          fill_opacity=.3,
-                                          text=_text_getter(tc))
-                else:
-                    img_matrix = draw_box(box=bbox.bbox,
-                                          img_matrix=img_matrix,
-                                          stroke_color=variables.TEXTCONTAINERS_TYPES_TO_COLORS[tc.type],
-                                          stroke_thickness=2,
-                                          fill_color=variables.TEXTCONTAINERS_TYPES_TO_COLORS[tc.type],
-                                          fill_opacity=.3)
+    styles_to_boxes = {}  # Maps (color, stroke_thickness, fill_opacity) tuples to lists of bboxes
+    labels = []  # A list of (bbox, text) tuples
 
+    for tc in textcontainers:
+        style, boxes = _TC_TYPES_TO_STYLE_GETTERS.get(tc.type, _get_default_style_and_boxes)(tc)
+        if boxes:
+            styles_to_boxes.setdefault(style, []).extend(boxes)
+            text = _text_getter(tc)
+            if text is not None:
+                labels.append((boxes[-1], text))  # We write the label on the last bbox only to avoid overlap
 
-        else:
+    for (color, stroke_thickness, fill_opacity), boxes in styles_to_boxes.items():
+        img_matrix = draw_boxes(boxes, img_matrix, color=color, stroke_thickness=stroke_thickness, fill_opacity=fill_opacity)
 
-            img_matrix = draw_box(box=tc.bbox.bbox,
-                                  img_matrix=img_matrix,
-                                  stroke_color=variables.TEXTCONTAINERS_TYPES_TO_COLORS[tc.type],
-                                  stroke_thickness=1,
-                                  fill_color=variables.TEXTCONTAINERS_TYPES_TO_COLORS[tc.type],
-                                  fill_opacity=.2,
-                                  text=_text_getter(tc))
+    for box, text in labels:
+        img_matrix = draw_box_label(box, img_matrix, text)
 
     if output_path is not None:
         cv2.imwrite(str(output_path), img_matrix)
@@ -270,12 +359,15 @@ def draw_reading_order(img_matrix: np.ndarray,
 
 
 def find_contours(img_matrix: np.ndarray,
-                  binarize: bool = True) -> List[Shape]:
+                  binarize: bool = True,
+                  approximation_method: int = cv2.CHAIN_APPROX_SIMPLE) -> List[Shape]:
     """Finds contours using ``cv2.findContours``, potentially binarizing the image first.
 
     Args:
         img_matrix (np.ndarray): The image matrix to find contours in.
         binarize (bool): Whether to binarize the image first.
+        approximation_method (int): The ``cv2`` contour approximation method. ``cv2.CHAIN_APPROX_TC89_KCOS`` yields far
+            fewer points per contour, at the cost of possibly dropping extreme points (and hence shrinking bboxes).
 
     Returns:
         List[Shape]: A list of ``Shape`` s representing the contours.
@@ -283,16 +375,15 @@ def find_contours(img_matrix: np.ndarray,
 
     # This has to be done in cv2. Using cv2.THRESH_BINARY_INV to avoid looking for the white background as a contour
     if binarize:
-        gray = cv2.cvtColor(img_matrix, cv2.COLOR_BGR2GRAY)
-        thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_OTSU | cv2.THRESH_BINARY_INV)[1]
+        thresh = cv2.threshold(to_grayscale(img_matrix), 0, 255, cv2.THRESH_OTSU | cv2.THRESH_BINARY_INV)[1]
     else:
         thresh = img_matrix
 
     # alternative: CHAIN_APPROX_NONE
-    contours, _ = cv2.findContours(thresh, mode=cv2.RETR_EXTERNAL, method=cv2.CHAIN_APPROX_SIMPLE)
+    contours, _ = cv2.findContours(thresh, mode=cv2.RETR_EXTERNAL, method=approximation_method)
 
-    # Discard single-point contours
-    contours = [Shape.from_numpy_array(c) for c in contours if len(c) > 1]
+    # Discard single-point contours. cv2 contours are (N,1,2)-shaped, so we can skip ``Shape.from_numpy_array``'s checks
+    contours = [Shape(c[:, 0].tolist()) for c in contours if len(c) > 1]
 
     return contours
 
@@ -301,8 +392,7 @@ def draw_contours(img_matrix: np.ndarray,
                   contours: List[Shape],
                   outfile: Optional[Union[str, Path]] = None):
     """Draws the contours of an ``img_matrix`` on a white image."""
-    white = np.zeros([img_matrix.matrix.shape[0], img_matrix.matrix.shape[1], 3], dtype=np.uint8)
-    white.fill(255)
+    white = np.full(img_matrix.shape[:2] + (3,), 255, dtype=np.uint8)
 
     for c in contours:
         color = (random.randint(0, 255),
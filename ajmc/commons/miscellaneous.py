@@ -31,11 +31,20 @@ def timer(iterations: int = 3, number: int = 1_000):
 
     def timer_decorator(func):
         def inner(*args, **kwargs):
-            statement = lambda: func(*args, **kwargs)
+            result = None
+
+            def statement():  # Keeps the last result, so that ``func`` needs not be run once more to return it
+                nonlocal result
+                result = func(*args, **kwargs)
+
             for i in range(iterations):
                 print(
                         f"""Func: {func.__name__}, Iteration {i}. Elapsed time for {number} executions :   {timeit.timeit(statement, number=number)}""")
-            return statement()
+
+            if not (iterations and number):  # ``func`` has not been run at all
+                statement()
+
+            return result
 
         return inner
 
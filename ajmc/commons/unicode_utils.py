@@ -2,7 +2,10 @@
 
 import re
 import unicodedata
-from typing import List, Tuple, Callable
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Tuple
+
+import numpy as np
 
 from ajmc.commons.arithmetic import safe_divide
 
@@ -192,16 +195,71 @@ def get_all_chars_from_ranges(ranges: List[Tuple[str, str]]) -> str:
     return ''.join([get_all_chars_from_range(start, end) for start, end in ranges])
 
 
+def get_codepoints_bounds(codepoints: Iterable[int]) -> np.ndarray:
+    """Merges codepoints into contiguous ranges and flattens their boundaries.
+
+    Note:
+        Each range ``[start, stop)`` contributes ``start`` and ``stop`` to the returned array, so that a codepoint ``cp``
+        belongs to one of the ranges iff ``np.searchsorted(bounds, cp, side='right')`` is odd.
+
+    Args:
+        codepoints (Iterable[int]): The codepoints to merge.
+
+    Returns:
+        np.ndarray: A sorted ``uint32`` array of boundaries.
+    """
+    bounds = []
+    for codepoint in sorted(set(codepoints)):
+        if bounds and bounds[-1] == codepoint:
+            bounds[-1] = codepoint + 1
+        else:
+            bounds += [codepoint, codepoint + 1]
+    return np.array(bounds, dtype=np.uint32)
+
+
+def get_charsets_lookup_table(charsets_chars: Dict[str, str]) -> bytearray:
+    """Builds a table mapping each codepoint to ``1 +`` the index of the first charset containing it, ``0`` if none.
+
+    Args:
+        charsets_chars (dict): A dictionary mapping charset names to their chars.
+
+    Returns:
+        bytearray: The lookup table, indexed by codepoint up to the highest codepoint of all charsets.
+    """
+    table = bytearray(max(max(map(ord, chars)) for chars in charsets_chars.values()) + 1)
+    # Iterating backwards so that earlier charsets take precedence over later ones for shared codepoints
+    for i, chars in reversed(list(enumerate(charsets_chars.values(), start=1))):
+        for char in chars:
+            table[ord(char)] = i
+    return table
+
+
+def get_ascii_translation_table(codepoints: Iterable[int]) -> bytes:
+    """Builds a 256-byte ``bytes.translate`` table mapping the bytes in ``codepoints`` to ``1`` and others to ``0``."""
+    codepoints = set(codepoints)
+    return bytes(int(i in codepoints) for i in range(256))
+
+
+def get_string_codepoints(string: str) -> np.ndarray:
+    """Returns the codepoints of ``string`` as a ``uint32`` array, without iterating over its chars in python."""
+    return np.frombuffer(string.encode('utf-32-le', errors='surrogatepass'), dtype=np.uint32)
+
+
+def count_codepoints_within_bounds(codepoints: np.ndarray, bounds: np.ndarray) -> int:
+    """Counts the ``codepoints`` falling within the ranges delimited by ``bounds`` (see ``get_codepoints_bounds``)."""
+    return int(np.count_nonzero(np.searchsorted(bounds, codepoints, side='right') & 1))
+
+
 CHARSETS_RANGES = {
-    'latin': [('A', 'Z'), ('a', 'z'), ('\u00C0', '\u00FF'), ('\u0152', '\u0152'), ('\u0153', '\u0153')],
+    'latin': [('A', 'Z'), ('a', 'z'), ('\u00C0', '\u00FF'), ('\u0152', '\u0153')],
     'greek': [('\u0386', '\u038A'), ('\u038C', '\u038C'), ('\u038E', '\u03A1'), ('\u03A3', '\u03E1'),  # standard greek, no coptic/separate diacritics
               ('\u1F00', '\u1F15'), ('\u1F18', '\u1F1D'), ('\u1F20', '\u1F45'), ('\u1F48', '\u1F4D'),  # polytonic greek...
               ('\u1F50', '\u1F57'), ('\u1F59', '\u1F59'), ('\u1F5B', '\u1F5B'), ('\u1F5D', '\u1F5D'),
               ('\u1F5F', '\u1F7D'), ('\u1F80', '\u1FB4'), ('\u1FB6', '\u1FBC'), ('\u1FBE', '\u1FBE'),
               ('\u1FC2', '\u1FC4'), ('\u1FC6', '\u1FCC'), ('\u1FD0', '\u1FD3'), ('\u1FD6', '\u1FDB'),
               ('\u1FE0', '\u1FEC'), ('\u1FF2', '\u1FF4'), ('\u1FF6', '\u1FFC'), ('\u2126', '\u2126'),
-              ('\u0300', '\u0300'), ('\u0301', '\u0301'), ('\u0313', '\u0313'), ('\u0314', '\u0314'),
-              ('\u0345', '\u0345'), ('\u0342', '\u0342'), ('\u0308', '\u0308'), ('·', '·'), ('\u0384', '\u0384')],
+              ('\u0300', '\u0301'), ('\u0308', '\u0308'), ('\u0313', '\u0314'), ('\u0342', '\u0342'),  # combining diacritics...
+              ('\u0345', '\u0345'), ('·', '·'), ('\u0384', '\u0384')],
     'numeral': [('0', '9')],
     'punctuation': [('\u0020', '\u002F'), ('\u003A', '\u003F'), ('\u005B', '\u0060'), ('\u007B', '\u007E'), ('\u00A8', '\u00A8'),
                     ('\u00B7', '\u00B7')]
@@ -211,7 +269,66 @@ CHARSETS_CHARS_NFC = {charset: get_all_chars_from_ranges(ranges) for charset, ra
 
 CHARSETS_CHARS_NFD = {charset: ''.join(set(unicodedata.normalize('NFD', charset_chars))) for charset, charset_chars in CHARSETS_CHARS_NFC.items()}
 
-CHARSETS_PATTERNS = {charset: re.compile(rf'[{charset_chars}]', re.UNICODE) for charset, charset_chars in CHARSETS_CHARS_NFC.items()}
+# Frozensets of chars let short strings be counted without first mapping them to codepoints.
+CHARSETS_CHARS_SETS_NFC = {charset: frozenset(charset_chars) for charset, charset_chars in CHARSETS_CHARS_NFC.items()}
+
+CHARSETS_CHARS_SETS_NFD = {charset: frozenset(charset_chars) for charset, charset_chars in CHARSETS_CHARS_NFD.items()}
+
+CHARSETS_NAMES = list(CHARSETS_CHARS_NFC.keys())
+
+CHARSETS_LOOKUP_TABLE = get_charsets_lookup_table(CHARSETS_CHARS_NFC)
+
+CHARSETS_BOUNDS_NFC = {charset: get_codepoints_bounds(map(ord, charset_chars)) for charset, charset_chars in CHARSETS_CHARS_NFC.items()}
+
+CHARSETS_BOUNDS_NFD = {charset: get_codepoints_bounds(map(ord, charset_chars)) for charset, charset_chars in CHARSETS_CHARS_NFD.items()}
+
+# ASCII strings are invariant under normalisation and share the same ASCII codepoints in NFC and NFD, hence one table.
+CHARSETS_ASCII_TABLES = {charset: get_ascii_translation_table(map(ord, charset_chars)) for charset, charset_chars in CHARSETS_CHARS_NFC.items()}
+
+
+# Below this length, numpy's dispatch overhead outweighs its vectorised scan and plain set lookups are faster.
+VECTORISED_COUNT_MIN_LENGTH = 48
+
+
+def _count_chars_within_charset(string: str,
+                                charset: str,
+                                charsets_chars_sets: Dict[str, frozenset],
+                                charsets_bounds: Dict[str, np.ndarray]) -> int:
+    """Counts the chars of ``string`` belonging to ``charset``.
+
+    Note:
+        ASCII strings are counted with ``bytes.translate``. Other strings shorter than ``VECTORISED_COUNT_MIN_LENGTH``
+        are counted with set lookups. Longer strings are decoded to a codepoints array, searched with numpy.
+    """
+    if string.isascii():
+        return string.encode('ascii').translate(CHARSETS_ASCII_TABLES[charset]).count(1)
+    elif len(string) < VECTORISED_COUNT_MIN_LENGTH:
+        return sum(map(charsets_chars_sets[charset].__contains__, string))
+    return count_codepoints_within_bounds(get_string_codepoints(string), charsets_bounds[charset])
+
+
+@lru_cache(maxsize=256)
+def compile_charset_pattern(charset: str) -> re.Pattern:
+    """Compiles a user-supplied charset ``re``-pattern, caching it for subsequent calls."""
+    return re.compile(charset, re.UNICODE)
+
+
+@lru_cache(maxsize=None)  # Only ever holds the few builtin charsets
+def _compile_builtin_charset_pattern(charset: str) -> re.Pattern:
+    """Compiles the ``re``-pattern of a builtin charset, caching it for subsequent calls."""
+    return re.compile(rf'[{CHARSETS_CHARS_NFC[charset]}]', re.UNICODE)
+
+
+def get_charset_pattern(charset: str) -> re.Pattern:
+    """Returns the compiled ``re``-pattern of a builtin charset, compiling it on first use only.
+
+    Args:
+        charset: should be ``'greek'``, ``'latin'``, ``'numeral'``, ``'punctuation'`` or a valid ``re``-pattern,
+                    for instance ``r'([\u00F4-\u00FF])'``
+    """
+    if charset in CHARSETS_CHARS_NFC:
+        return _compile_builtin_charset_pattern(charset)
+    return compile_charset_pattern(charset)
 
 
 def chunk_string_by_charsets(string: str, fallback: str = 'latin'):
@@ -229,37 +346,37 @@ def chunk_string_by_charsets(string: str, fallback: str = 'latin'):
     """
 
     chunks = []
-    chunk = string[0]
-    chunk_charset = get_char_charset(chunk, fallback=fallback)
+    chunk_start = 0
+    chunk_charset = get_char_charset(string[0], fallback=fallback)
 
-    for char in string[1:]:
-        char_charset = get_char_charset(char, fallback=fallback)
+    for i, char in enumerate(string[1:], start=1):
+        if char.isspace():  # Whitespaces are appended to the current chunk, whatever their charset
+            continue
 
-        if any([re.match(r'\s', char),
-                char_charset == chunk_charset]):
-            chunk += char
-
-        else:
-            chunks.append((chunk, chunk_charset))
-            chunk, chunk_charset = char, char_charset
+        char_charset = get_char_charset(char, fallback=fallback)
+        if char_charset != chunk_charset:
+            chunks.append((string[chunk_start:i], chunk_charset))
+            chunk_start, chunk_charset = i, char_charset
 
-    chunks.append((chunk, chunk_charset))
+    chunks.append((string[chunk_start:], chunk_charset))
     return chunks
 
 
 def get_char_charset(char: str, fallback: str = 'fallback') -> str:
     """Returns the charset of a character, if any, ``fallback`` otherwise."""
-    for charset_name, charset_chars in CHARSETS_CHARS_NFC.items():
-        if char in charset_chars:
-            return charset_name
-    else:
-        return fallback
+    codepoint = ord(char)
+    if codepoint < len(CHARSETS_LOOKUP_TABLE) and CHARSETS_LOOKUP_TABLE[codepoint]:
+        return CHARSETS_NAMES[CHARSETS_LOOKUP_TABLE[codepoint] - 1]
+    return fallback
 
 
 def get_string_charset(string: str, fallback: str = 'latin') -> str:
     """Returns the charset of a string, if any, ``fallback`` otherwise."""
-    charsets = [get_char_charset(char, fallback=fallback) for char in string]
-    return max(set(charsets), key=charsets.count)
+    charsets_counts = {}
+    for char in string:
+        charset = get_char_charset(char, fallback=fallback)
+        charsets_counts[charset] = charsets_counts.get(charset, 0) + 1
+    return max(charsets_counts, key=charsets_counts.__getitem__)  # Ties go to the charset met first
 
 def count_chars_by_charset(string: str, charset: str) -> int:
     """Counts the number of chars by unicode characters set.
@@ -270,12 +387,15 @@ def count_chars_by_charset(string: str, charset: str) -> int:
 
     Args:
         string: a NFC-normalized string (default). For NFD-normalized strings, use ``count_chars_by_charset_nfd``.
-        charset: should be ``'greek'``, ``'latin'``, ``'numeral'``, ``'punctuation'``.
+        charset: should be ``'greek'``, ``'latin'``, ``'numeral'``, ``'punctuation'`` or a valid ``re``-pattern,
+                    for instance ``r'([\u00F4-\u00FF])'``
 
     Returns:
         int: the number of charset-matching characters in ``string``.
     """
-    return sum([c in CHARSETS_CHARS_NFC[charset] for c in string])
+    if charset in CHARSETS_BOUNDS_NFC:
+        return _count_chars_within_charset(string, charset, CHARSETS_CHARS_SETS_NFC, CHARSETS_BOUNDS_NFC)
+    return len(compile_charset_pattern(charset).findall(string))
 
 
 def count_chars_by_charset_nfd(string: str, charset: str) -> int:
@@ -292,7 +412,7 @@ def count_chars_by_charset_nfd(string: str, charset: str) -> int:
     Returns:
         int: the number of charset-matching characters in ``string``.
     """
-    return sum([c in CHARSETS_CHARS_NFD[charset] for c in string])
+    return _count_chars_within_charset(string, charset, CHARSETS_CHARS_SETS_NFD, CHARSETS_BOUNDS_NFD)
 
 
 def is_charset_string(string: str,
@@ -310,11 +430,13 @@ def is_charset_string(string: str,
                 ``'punctuation'`` are considered.
     """
 
-    if strict:
-        return safe_divide(count_chars_by_charset(string=string, charset=charset), len(string)) >= threshold
-    else:
-        return safe_divide(sum(count_chars_by_charset(string, charset_) for charset_ in [charset, 'numeral', 'punctuation']),
-                           len(string)) >= threshold
+    charsets = [charset] if strict else [charset, 'numeral', 'punctuation']
+    count = 0
+    for charset in charsets:
+        count += _count_chars_within_charset(string, charset, CHARSETS_CHARS_SETS_NFC, CHARSETS_BOUNDS_NFC)
+        if safe_divide(count, len(string)) >= threshold:  # Counts only grow, no need to count the remaining charsets
+            return True
+    return False
 
 
 def is_charset_string_nfd(string: str,
@@ -331,10 +453,13 @@ def is_charset_string_nfd(string: str,
                 ``'punctuation'`` are considered.
     """
 
-    if strict:
-        return count_chars_by_charset_nfd(string=string, charset=charset) / len(string) >= threshold
-    else:
-        return sum(count_chars_by_charset_nfd(string, charset_) for charset_ in [charset, 'numeral', 'punctuation']) / len(string) >= threshold
+    charsets = [charset] if strict else [charset, 'numeral', 'punctuation']
+    count = 0
+    for charset in charsets:
+        count += _count_chars_within_charset(string, charset, CHARSETS_CHARS_SETS_NFD, CHARSETS_BOUNDS_NFD)
+        if count / len(string) >= threshold:  # Counts only grow, no need to count the remaining charsets
+            return True
+    return False
 
 
 def get_char_unicode_name(char: str) -> str:
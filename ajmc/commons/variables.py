@@ -506,6 +506,10 @@ TEXTCONTAINERS_TYPES_TO_COLORS = {
 REGION_TYPES_TO_COLORS = {l: c for l, c in zip(ORDERED_OLR_REGION_TYPES,
                                                list(COLORS['distinct'].values()) + 2 * list(COLORS['hues'].values()))}
 
+# BGR counterparts of the palettes above, as expected by cv2
+TEXTCONTAINERS_TYPES_TO_BGR = {t: c[::-1] for t, c in TEXTCONTAINERS_TYPES_TO_COLORS.items()}
+REGION_TYPES_TO_BGR = {l: c[::-1] for l, c in REGION_TYPES_TO_COLORS.items()}
+
 # ======================================================================================================================
 #                                                 MISC
 # ======================================================================================================================
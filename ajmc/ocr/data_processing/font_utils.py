@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Iterable, Optional, List
 
@@ -15,6 +16,12 @@ def walk_through_font_dir(font_dir: Path):
             yield font_path
 
 
+@lru_cache(maxsize=64)
+def get_pil_font(path: str, size: int, index: int, encoding: str, layout_engine: int) -> ImageFont.FreeTypeFont:
+    """Loads a ``PIL`` font, caching it so that a given font file is only parsed once per size."""
+    return ImageFont.truetype(font=path, size=size, index=index, encoding=encoding, layout_engine=layout_engine)
+
+
 class Font:
 
     def __init__(self,
@@ -74,11 +81,11 @@ class Font:
 
     @lazy_property
     def pil_font(self):
-        return ImageFont.truetype(font=str(self.path),
-                                  size=self.size,
-                                  index=self.get_font_variant_index(),
-                                  encoding=self.pil_encoding,
-                                  layout_engine=self.pil_layout_engine)
+        return get_pil_font(path=str(self.path),
+                            size=self.size,
+                            index=self.get_font_variant_index(),
+                            encoding=self.pil_encoding,
+                            layout_engine=self.pil_layout_engine)
 
 
     def has_glyph(self, glyph: str) -> bool:
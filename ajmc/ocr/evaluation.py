@@ -19,7 +19,7 @@ from ajmc.commons import variables as vs
 from ajmc.commons.arithmetic import safe_divide
 from ajmc.commons.geometry import are_bboxes_overlapping_with_threshold, is_bbox_within_bbox
 from ajmc.commons.miscellaneous import get_ajmc_logger
-from ajmc.commons.unicode_utils import harmonise_unicode, count_chars_by_charset, CHARSETS_PATTERNS
+from ajmc.commons.unicode_utils import harmonise_unicode, count_chars_by_charset, get_charset_pattern, CHARSETS_NAMES
 from ajmc.ocr import variables as ocr_vs
 from ajmc.text_processing.raw_classes import RawCommentary, RawPage
 
@@ -132,11 +132,7 @@ def count_errors_by_charset(gt_string: str, pred_string: str, charset: str) -> i
         int: the number of errors on selected caracters in ``pred_string``
     """
 
-    try:
-        pattern = CHARSETS_PATTERNS[charset]
-    except KeyError:
-        pattern = re.compile(charset, re.UNICODE)
-
+    pattern = get_charset_pattern(charset)
     indices = [m.span()[0] for m in re.finditer(pattern, gt_string)]
     editops = Levenshtein.editops(pred_string, gt_string)
 
@@ -477,7 +473,7 @@ def directory_evaluation(gt_dir: Path,
         error_record['words'].append(len(gt_text.split(' ')))
         error_record['words_distance'].append(Levenshtein.distance(gt_text.split(), ocr_text.split()))
 
-        for charset in CHARSETS_PATTERNS.keys():
+        for charset in CHARSETS_NAMES:
             error_record[f'{charset}_chars'].append(count_chars_by_charset(gt_text, charset))
             error_record[f'{charset}_chars_distance'].append(count_errors_by_charset(gt_text, ocr_text, charset))
 
@@ -562,7 +558,7 @@ def line_based_evaluation(gt_lines: List[str],
         error_record['words'].append(len(gt_text.split(' ')))
         error_record['words_distance'].append(Levenshtein.distance(gt_text.split(), ocr_text.split()))
 
-        for charset in CHARSETS_PATTERNS.keys():
+        for charset in CHARSETS_NAMES:
             error_record[f'{charset}_chars'].append(count_chars_by_charset(gt_text, charset))
             error_record[f'{charset}_chars_distance'].append(count_errors_by_charset(gt_text, ocr_text, charset))
 
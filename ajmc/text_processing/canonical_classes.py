@@ -1,23 +1,152 @@
 """This module contains objects for the manipulation of canonical textcontainers."""
 
 import json
+import os
+import sys
 from abc import abstractmethod
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple, Type, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
 
-from jinja2 import Environment, PackageLoader
+import numpy as np
 from lazy_objects.lazy_objects import lazy_property, LazyObject
 
 from ajmc.commons import variables as vs
-from ajmc.commons.arithmetic import is_interval_within_interval
 from ajmc.commons.docstrings import docstring_formatter, docstrings
-from ajmc.commons.geometry import get_bbox_from_points, Shape
+from ajmc.commons.geometry import Shape
 from ajmc.commons.image import AjmcImage
 from ajmc.commons.miscellaneous import get_ajmc_logger
 from ajmc.text_processing.generic_classes import Commentary, Page, TextContainer
 
 logger = get_ajmc_logger(__name__)
 
+try:  # orjson is an optional, much faster backend for canonical jsons
+    import orjson
+except ImportError:
+    orjson = None
+
+# Set ``AJMC_JSON_BACKEND=json`` to force the standard library backend, e.g. for reproducible outputs.
+USE_ORJSON = orjson is not None and os.getenv('AJMC_JSON_BACKEND', 'orjson') == 'orjson'
+
+try:  # ijson is optional too, to parse very large canonical jsons incrementally
+    import ijson
+except ImportError:
+    ijson = None
+
+# Above this size (in bytes), canonical jsons are parsed incrementally if ``ijson`` is installed. Streaming only spares
+# the raw parsed json, which is small next to the commentary built from it, and is much slower: on a synthetic 44 MB
+# canonical json, it lowered peak memory from ~176 MB to ~144 MB but took 2.5s instead of 1.1s (with orjson). It hence
+# only pays off for files large enough for their raw parse to threaten memory.
+STREAMING_MIN_FILE_SIZE = 1024 ** 3
+
+# Textcontainers are serialised by chunks of this size when exporting canonical jsons. Larger chunks save calls to the
+# json backend but hold more dicts in memory.
+JSON_DUMP_CHUNK_SIZE = 1000
+
+# Textcontainers' fields drawn from a small vocabulary, interned at load time so that all textcontainers share the same
+# string objects.
+INTERNED_FIELDS = {'regions': ['region_type'], 'entities': ['label'], 'lemmas': ['label']}
+
+# Top-level fields of canonical jsons needed to create the commentary, before any of its textcontainers
+HEADER_FIELDS = ('id', 'metadata', 'ocr_gt_page_ids', 'olr_gt_page_ids', 'ner_gt_page_ids', 'lem_link_gt_page_ids')
+
+
+def load_json(json_path: Path):
+    """Loads a json file at once, with the selected backend."""
+    if USE_ORJSON:
+        return orjson.loads(json_path.read_bytes())
+    return json.loads(json_path.read_text(encoding='utf-8'))
+
+
+def iter_loaded_canonical_json(can_json: dict) -> Iterator[Tuple[str, Any]]:
+    """Iterates over a loaded canonical json like ``iter_canonical_json``, popping each textcontainer dict out of
+    ``can_json`` so that it can be freed as soon as it is consumed."""
+    raw_children = can_json.pop('children')
+    yield from can_json.items()
+    for tc_type in list(raw_children):
+        tcs = raw_children.pop(tc_type)
+        tcs.reverse()  # So that textcontainers can be popped from the end, in order
+        while tcs:
+            yield 'children', (tc_type, tcs.pop())
+
+
+def _build_json_value(events: Iterator[Tuple[str, Any]], event: str, value: Any) -> Any:
+    """Builds the json value starting with ``(event, value)`` out of ``ijson.basic_parse`` ``events``."""
+    if event not in ('start_map', 'start_array'):  # Scalar
+        return value
+
+    builder, depth = ijson.ObjectBuilder(), 0
+    while True:
+        builder.event(event, value)
+        depth += event in ('start_map', 'start_array')
+        depth -= event in ('end_map', 'end_array')
+        if depth == 0:
+            return builder.value
+        event, value = next(events)
+
+
+def iter_canonical_json(json_path: Path) -> Iterator[Tuple[str, Any]]:
+    """Parses a canonical json incrementally with ``ijson``, building one textcontainer dict at a time.
+
+    Warning:
+        Top-level fields are yielded in the order of the file, so they may come after textcontainers (e.g. in jsons
+        dumped with ``sort_keys``). See ``_iter_streamed_canonical_json`` for the fallback used by ``from_json``.
+
+    Yields:
+        A ``(key, value)`` tuple for each top-level field but ``'children'``, and a ``('children', (tc_type, tc))``
+        tuple for each textcontainer dict, in the order of the file.
+    """
+    with open(json_path, 'rb') as f:
+        events = ijson.basic_parse(f, use_float=True)
+        next(events)  # The root's ``start_map``
+        for event, key in events:  # Top-level ``map_key`` events, until the root's ``end_map``
+            if event == 'end_map':
+                break
+            if key != 'children':
+                yield key, _build_json_value(events, *next(events))
+                continue
+
+            next(events)  # The children map's ``start_map``
+            for event, tc_type in events:  # Children types' ``map_key`` events, until the children map's ``end_map``
+                if event == 'end_map':
+                    break
+                next(events)  # The children list's ``start_array``
+                for event, value in events:
+                    if event == 'end_array':
+                        break
+                    yield 'children', (tc_type, _build_json_value(events, event, value))
+
+
+def _iter_streamed_canonical_json(json_path: Path) -> Iterator[Tuple[str, Any]]:
+    """Wraps ``iter_canonical_json``, falling back to ``iter_loaded_canonical_json`` if a textcontainer comes before
+    all ``HEADER_FIELDS``, as ``CanonicalCommentary.from_json`` needs them to create the commentary."""
+    can_json_items = iter_canonical_json(json_path)
+    header_keys = set()
+    for key, value in can_json_items:
+        if key != 'children':
+            header_keys.add(key)
+            yield key, value
+            continue
+
+        if header_keys.issuperset(HEADER_FIELDS):
+            yield key, value
+            yield from can_json_items
+        else:  # No textcontainer has been yielded yet, so the loaded json can be iterated over from the start
+            can_json_items.close()
+            logger.debug(f'{json_path} lacks top-level fields before ``children``, loading it at once.')
+            yield from iter_loaded_canonical_json(load_json(json_path))
+        return
+
+
+def dumps_json(obj, depth: int = 0) -> bytes:
+    """Serialises ``obj`` to utf-8 json, indented by 2 spaces, as if it were nested ``depth`` levels deep."""
+    if USE_ORJSON:
+        dumped = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        dumped = json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    # Json strings cannot contain raw newlines, so these are all structural
+    return dumped.replace(b'\n', b'\n' + b'  ' * depth) if depth else dumped
+
 
 class CanonicalTextContainer(TextContainer):
 
@@ -36,43 +165,66 @@ class CanonicalTextContainer(TextContainer):
             - This methods does retrieve elements which overlap only partially with ``self``.
         """
 
-        if children_type == 'words':  # Special efficiency hack for words
-            return self.parents.commentary.children.words[self.word_range[0]:self.word_range[1] + 1]
+        commentary = self.parents.commentary
+        start, end = self.word_range
 
-        # General case
-        return [tc for tc in getattr(self.parents.commentary.children, children_type)
-                if is_interval_within_interval(contained=tc.word_range, container=self.word_range)
-                and self.id != tc.id]
+        if children_type == 'words':  # Special efficiency hack for words
+            return commentary.children.words[start:end + 1]
+
+        # General case: only siblings starting within ``self.word_range`` can be contained in it. Empty word ranges
+        # (e.g. ``(n, n - 1)`` for pages without words) start right after it, hence ``end + 1``.
+        candidates, starts, ends, _, positions = commentary._get_children_index(children_type)
+        lo = np.searchsorted(starts, start, side='left')
+        hi = np.searchsorted(starts, end + 1, side='right')
+        contained = np.sort(positions[lo:hi][ends[lo:hi] <= end]).tolist()
+        if children_type != vs.TC_TYPES_TO_CHILD_TYPES[self.type]:  # ``self`` can only be among its own siblings
+            return [candidates[i] for i in contained]
+        return [candidates[i] for i in contained if self.id != candidates[i].id]
 
     def _get_parent(self, parent_type: str) -> Optional[Type['CanonicalTextContainer']]:
 
         if parent_type == 'commentary':
             raise NotImplementedError('``CanonicalTextContainer.parents.commentary`` must be set at __init__')
 
-        for tc in getattr(self.parents.commentary.children, vs.TC_TYPES_TO_CHILD_TYPES[parent_type]):
-            if is_interval_within_interval(contained=self.word_range, container=tc.word_range) and self.id != tc.id:
-                return tc
-
-    @lazy_property
+        # Containers start before ``self``. As ``max_ends`` is sorted, the first of them which may end after ``self`` is
+        # found by bisection too.
+        start, end = self.word_range
+        candidates, starts, ends, max_ends, positions = \
+            self.parents.commentary._get_children_index(vs.TC_TYPES_TO_CHILD_TYPES[parent_type])
+        hi = np.searchsorted(starts, start, side='right')
+        lo = np.searchsorted(max_ends[:hi], end, side='left')
+        containers = np.sort(positions[lo:hi][ends[lo:hi] >= end]).tolist()
+        for i in containers:  # Keeps the first container in children order
+            if parent_type != self.type or self.id != candidates[i].id:
+                return candidates[i]
+
+    # These are accessed in tight loops (e.g. ``_get_children``). Unlike ``lazy_property``, ``cached_property`` is a
+    # non-data descriptor: once computed (or set at init), they are read straight from the instance's ``__dict__``.
+    @cached_property
     def id(self) -> str:
         """Generic method to create a ``CanonicalTextContainer``'s id."""
         return self.type + '_' + str(self.index)
 
-    @lazy_property
+    @cached_property
     def index(self) -> int:
-        """Generic method to get a ``CanonicalTextContainer``'s index in its parent commentary's children list."""
+        """Generic method to get a ``CanonicalTextContainer``'s index in its parent commentary's children list.
+
+        Note:
+            This is only a fallback, as commentaries store their children's indices when building them.
+        """
         return getattr(self.parents.commentary.children, vs.TC_TYPES_TO_CHILD_TYPES[self.type]).index(self)
 
-    @lazy_property
+    @cached_property
     def word_range(self) -> Tuple[int, int]:
         return self.word_range
 
-    @lazy_property
+    @cached_property
     def bbox(self) -> Shape:
         """Generic method to get a ``CanonicalTextContainer``'s bbox."""
-        return Shape(get_bbox_from_points([xy for w in self.children.words for xy in w.bbox.bbox]))
+        points = self.parents.commentary.words_bboxes[self.word_range[0]:self.word_range[1] + 1].reshape(-1, 2)
+        return Shape((tuple(points.min(axis=0).tolist()), tuple(points.max(axis=0).tolist())))
 
-    @lazy_property
+    @cached_property
     def image(self) -> AjmcImage:
         """Generic method to create a ``CanonicalTextContainer``'s image."""
         return self.parents.page.image.crop(self.bbox.bbox)
@@ -115,6 +267,8 @@ class CanonicalCommentary(Commentary):
                          lemlink_gt_page_ids=lemlink_gt_page_ids,
                          metadata=metadata,
                          **kwargs)
+        self._children_index = {}
+        self._words_bboxes = None  # A ``(words, bboxes)`` tuple, see ``words_bboxes``
 
     @classmethod
     def from_json(cls,
@@ -128,6 +282,11 @@ class CanonicalCommentary(Commentary):
             ajmc folder structure.
             id: The id of the commentary.
             ocr_run_id: The id of the ocr run.
+
+        Note:
+            Jsons larger than ``STREAMING_MIN_FILE_SIZE`` are parsed incrementally if ``ijson`` is installed, so that
+            the raw json is never held in memory as a whole. Jsons with top-level fields after ``children`` are
+            still loaded at once.
         """
 
         if json_path is None:
@@ -139,64 +298,122 @@ class CanonicalCommentary(Commentary):
             logger.warning(f"The provided ``json_path`` ({json_path}) is not compliant with ajmc's folder structure.")
 
         logger.debug(f'Importing canonical commentary from {json_path}')
-        can_json = json.loads(json_path.read_text(encoding='utf-8'))
-
-        # Create the (empty) commentary and populate its info
-        commentary = cls(id=can_json['id'],
-                         children=None,
-                         images=None,
-                         ocr_run_id=can_json['metadata']['ocr_run_id'],
-                         ocr_gt_page_ids=can_json['ocr_gt_page_ids'],
-                         olr_gt_page_ids=can_json['olr_gt_page_ids'],
-                         ner_gt_page_ids=can_json['ner_gt_page_ids'],
-                         lemlink_gt_page_ids=can_json['lem_link_gt_page_ids'],
-                         metadata=can_json['metadata'])
-
-        # Automatically determinates paths
-
-        # Set its images
-        commentary.images = [
-            AjmcImage(id=img['id'], path=commentary.img_dir / (img['id'] + vs.DEFAULT_IMG_EXTENSION), word_range=img['word_range'])
-            for img in can_json['children']['pages']
-        ]
-
-        # Set its children
-        commentary.children = LazyObject(compute_function=lambda x: x, constrained_attrs=vs.CHILD_TYPES,
-                                         **{tc_type: [get_tc_type_class(tc_type)(commentary=commentary, **tc)
-                                                      for tc in can_json['children'].get(tc_type, [])]
-                                            for tc_type in vs.CHILD_TYPES if tc_type != 'words'})
-
-        # Special case of words which have no index in the canonical json
-        commentary.children.words = [get_tc_type_class('words')(commentary=commentary, index=i, word_range=(i, i), **tc)
-                                     for i, tc in enumerate(can_json['children']['words'])]
+        if ijson is not None and json_path.stat().st_size >= STREAMING_MIN_FILE_SIZE:
+            can_json_items = _iter_streamed_canonical_json(json_path)
+        else:
+            can_json_items = iter_loaded_canonical_json(load_json(json_path))
+
+        header = {}
+        commentary = None
+        images = []
+        children = {tc_type: [] for tc_type in vs.CHILD_TYPES}
+        words_bboxes = []
+
+        for key, value in can_json_items:
+            if key != 'children':
+                header[key] = value
+                continue
+
+            tc_type, tc = value
+            if tc_type not in children:
+                continue
+
+            # Create the (empty) commentary and populate its info, as soon as the header has been read
+            if commentary is None:
+                commentary = cls._from_json_header(header)
+                img_dir = commentary.img_dir  # Resolved once for all pages' images
+
+            for field in INTERNED_FIELDS.get(tc_type, []):
+                if isinstance(tc.get(field), str):
+                    tc[field] = sys.intern(tc[field])
+
+            # Create the textcontainer, storing its index to spare ``index`` a search through the list
+            tcs = children[tc_type]
+            if tc_type == 'words':  # Special case of words which have no index in the canonical json
+                tcs.append(get_tc_type_class(tc_type)(commentary=commentary, index=len(tcs),
+                                                      word_range=(len(tcs), len(tcs)), **tc))
+                words_bboxes.append(tc['bbox'])
+            else:
+                tcs.append(get_tc_type_class(tc_type)(commentary=commentary, **tc))
+                tcs[-1].index = len(tcs) - 1
+
+            if tc_type == 'pages':
+                images.append(AjmcImage(id=tc['id'], path=img_dir / (tc['id'] + vs.DEFAULT_IMG_EXTENSION),
+                                        word_range=tc['word_range']))
+
+        if commentary is None:
+            commentary = cls._from_json_header(header)
+
+        # Set its images and children
+        commentary.images = images
+        commentary.children = LazyObject(compute_function=lambda x: x, constrained_attrs=vs.CHILD_TYPES, **children)
+        commentary._words_bboxes = (commentary.children.words, np.array(words_bboxes).reshape(-1, 4))
 
         return commentary
 
-    def to_json(self, output_path: Optional[Union[str, Path]] = None) -> dict:
+    @classmethod
+    def _from_json_header(cls, header: dict) -> 'CanonicalCommentary':
+        """Creates an empty commentary from the top-level fields of a canonical json."""
+        missing_fields = [field for field in HEADER_FIELDS if field not in header]
+        if missing_fields:
+            raise ValueError(f'The canonical json lacks the top-level fields {missing_fields}.')
+        return cls(id=header['id'],
+                   children=None,
+                   images=None,
+                   ocr_run_id=header['metadata']['ocr_run_id'],
+                   ocr_gt_page_ids=header['ocr_gt_page_ids'],
+                   olr_gt_page_ids=header['olr_gt_page_ids'],
+                   ner_gt_page_ids=header['ner_gt_page_ids'],
+                   lemlink_gt_page_ids=header['lem_link_gt_page_ids'],
+                   metadata=header['metadata'])
+
+    def to_json(self, output_path: Optional[Union[str, Path]] = None):
         """Exports self to canonical json format.
 
+        Note:
+            Textcontainers are serialised and written by chunks of ``JSON_DUMP_CHUNK_SIZE``, so that the whole json
+            never has to be held in memory. With the standard library backend, the output is the same as
+            ``json.dumps(..., indent=2, ensure_ascii=False)``. ``orjson`` writes floats in their shortest form (e.g.
+            ``1e-7`` rather than ``1e-07``) and ``NaN`` and infinities as ``null``. The json is written to
+            ``<output_path>.tmp`` and only moved to ``output_path`` once complete.
+
         Args:
             output_path: The path to which the json should be exported. Leave empty to export to default location
-
-        Returns:
-            The json as a dictionary
         """
 
-        data = {'id': self.id,
-                'metadata': self.metadata,
-                'ocr_gt_page_ids': self.ocr_gt_page_ids,
-                'olr_gt_page_ids': self.olr_gt_page_ids,
-                'ner_gt_page_ids': self.ner_gt_page_ids,
-                'lem_link_gt_page_ids': self.lemlink_gt_page_ids,
-                'children': {child_type: [tc.to_json() for tc in getattr(self.children, child_type)]
-                             for child_type in vs.CHILD_TYPES}}
+        header = {'id': self.id,
+                  'metadata': self.metadata,
+                  'ocr_gt_page_ids': self.ocr_gt_page_ids,
+                  'olr_gt_page_ids': self.olr_gt_page_ids,
+                  'ner_gt_page_ids': self.ner_gt_page_ids,
+                  'lem_link_gt_page_ids': self.lemlink_gt_page_ids}
 
         if output_path is None:
             output_path = vs.get_comm_canonical_path_from_ocr_run_pattern(self.id, self.ocr_run_id)
 
-        output_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding='utf-8')
-
-        return data
+        # Written to a sibling temporary file first, so that a failure halfway never destroys an existing json
+        output_path = Path(output_path)
+        tmp_path = output_path.with_name(output_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(b'{')
+                for key, value in header.items():
+                    f.write(b'\n  ' + dumps_json(key) + b': ' + dumps_json(value, depth=1) + b',')
+
+                f.write(b'\n  "children": {')
+                for i, child_type in enumerate(vs.CHILD_TYPES):
+                    f.write((b',' if i else b'') + b'\n    ' + dumps_json(child_type) + b': [')
+                    children = getattr(self.children, child_type)
+                    for j in range(0, len(children), JSON_DUMP_CHUNK_SIZE):
+                        chunk = [tc.to_json() for tc in children[j:j + JSON_DUMP_CHUNK_SIZE]]
+                        # The chunk is dumped as a list, whose enclosing ``[`` and ``\n    ]`` are stripped
+                        f.write((b',' if j else b'') + dumps_json(chunk, depth=2)[1:-6])
+                    f.write(b'\n    ]' if children else b']')
+                f.write(b'\n  }\n}')
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        os.replace(tmp_path, output_path)
 
     def to_alto(self,
                 output_dir: Union[str, Path],
@@ -235,10 +452,49 @@ class CanonicalCommentary(Commentary):
     def _get_children(self, children_type) -> List[Optional[Type['TextContainer']]]:
         raise NotImplementedError('``CanonicalCommentary.children`` must be set at __init__.')
 
+    def _get_children_index(self, children_type: str) -> Tuple[list, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Indexes ``self.children`` of type ``children_type`` by word range, for vectorised searches in their
+        ``_get_children`` and ``_get_parent``.
+
+        Note:
+            The index is cached, and rebuilt if the children list is replaced or resized.
+
+        Returns:
+            A tuple ``(children, starts, ends, max_ends, positions)``, where ``children`` is the children list itself and
+            the others are arrays sorted by word-range start: ``starts`` and ``ends`` are the children's word-range
+            boundaries, ``max_ends`` the running maximum of ``ends`` and ``positions`` the children's positions in
+            ``children``.
+        """
+        children = getattr(self.children, children_type)
+        cached = self._children_index.get(children_type)
+        if cached is None or cached[0] is not children or len(cached[1]) != len(children):
+            starts = np.fromiter((tc.word_range[0] for tc in children), dtype=np.int64, count=len(children))
+            ends = np.fromiter((tc.word_range[1] for tc in children), dtype=np.int64, count=len(children))
+            positions = np.argsort(starts, kind='stable')
+            starts, ends = starts[positions], ends[positions]
+            cached = self._children_index[children_type] = (children, starts, ends, np.maximum.accumulate(ends), positions)
+        return cached
+
     @lazy_property
     def ocr_gt_pages(self) -> List[Type['CanonicalPage']]:
         """A list of ``CanonicalPage`` objects containing the groundtruth of the OCR."""
-        return [p for p in self.children.pages if p.id in self.ocr_gt_page_ids]
+        page_ids = set(self.ocr_gt_page_ids)
+        return [p for p in self.children.pages if p.id in page_ids]
+
+    @property
+    def words_bboxes(self) -> np.ndarray:
+        """The bboxes of ``self.children.words`` as an ``(N, 4)`` array of ``x1, y1, x2, y2`` rows, for vectorised
+        queries over words.
+
+        Note:
+            The array is cached, and rebuilt if the words list is replaced or resized. ``from_json`` builds it directly
+            from the json.
+        """
+        words = self.children.words
+        cached = self._words_bboxes
+        if cached is None or cached[0] is not words or len(cached[1]) != len(words):
+            cached = self._words_bboxes = (words, np.array([w.bbox.bbox for w in words]).reshape(-1, 4))
+        return cached[1]
 
 
 class CanonicalSection(CanonicalTextContainer):
@@ -260,6 +516,18 @@ class CanonicalSection(CanonicalTextContainer):
                 'word_range': self.word_range}
 
 
+@lru_cache(maxsize=None)
+def get_alto_template():
+    """Loads and compiles the ALTO-xml jinja template once, for it to be shared by all ``CanonicalPage.to_alto`` calls."""
+    from jinja2 import Environment, PackageLoader  # Imported here, as only needed for ALTO exports
+
+    env = Environment(loader=PackageLoader('ajmc', 'data/templates'),
+                      trim_blocks=True,
+                      lstrip_blocks=True,
+                      autoescape=True)
+    return env.get_template('alto.xml.jinja2')
+
+
 class CanonicalPage(Page, CanonicalTextContainer):
 
     def __init__(self, id: str, word_range: Tuple[int, int], commentary: CanonicalCommentary, **kwargs):
@@ -284,11 +552,7 @@ class CanonicalPage(Page, CanonicalTextContainer):
             region_types_ids: A dictionary mapping the values of ``region_types_mapping`` to the ids of regions in the ALTO-xml, for instance variables.REGION_TYPES_TO_SEGMONTO_ID
             regions_types: The types of regions to be exported, for instance variables.ROIS. This allows for filtering only the regions of interested, excluded regions types like 'undefined'.
         """
-        env = Environment(loader=PackageLoader('ajmc', 'data/templates'),
-                          trim_blocks=True,
-                          lstrip_blocks=True,
-                          autoescape=True)
-        template = env.get_template('alto.xml.jinja2')
+        template = get_alto_template()
 
         # xml_formatter = xmlformatter.Formatter(indent="1", indent_char="\t", encoding_output="UTF-8", correct=True)
         alto_xml_data = template.render(page=self,
@@ -337,15 +601,10 @@ class CanonicalWord(CanonicalTextContainer):
         return self.index, self.index
 
 
-# 👁️ not very elegant. try to revise.
 def get_tc_type_class(tc_type) -> Type[CanonicalTextContainer]:
-    if not tc_type.endswith('s'):
-        return globals()[f'Canonical{tc_type.capitalize()}']
-    else:
-        if tc_type.endswith('ies'):
-            return globals()[f'Canonical{tc_type[:-3].capitalize()}y']
-        else:
-            return globals()[f'Canonical{tc_type[:-1].capitalize()}']
+    """Returns the canonical class of a textcontainer type or child type, e.g. ``CanonicalEntity`` for ``'entity'``
+    or ``'entities'``."""
+    return _TC_TYPES_TO_CLASSES[tc_type]
 
 
 class CanonicalAnnotation(CanonicalTextContainer):
@@ -457,3 +716,9 @@ class CanonicalLemma(CanonicalAnnotation):
                 'transcript': self.transcript,
                 'label': self.label,
                 'anchor_target': self.anchor_target}
+
+
+# Resolved once at import, as ``get_tc_type_class`` is called for every textcontainer type when building commentaries
+_TC_TYPES_TO_CLASSES = {type_: globals()[f'Canonical{tc_type.capitalize()}']
+                        for tc_type in vs.TEXTCONTAINER_TYPES
+                        for type_ in (tc_type, vs.TC_TYPES_TO_CHILD_TYPES[tc_type])}
@@ -134,19 +134,22 @@ class Commentary(TextContainer):
     @lazy_property
     def olr_gt_pages(self) -> List[vs.PageType]:
         """A list of ``CanonicalPage`` objects containing the groundtruth of the OLR."""
-        return [p for p in self.children.pages if p.id in self.olr_gt_page_ids]
+        page_ids = set(self.olr_gt_page_ids)
+        return [p for p in self.children.pages if p.id in page_ids]
 
     @lazy_property
     def ner_gt_pages(self) -> List[vs.PageType]:
         """A list of ``CanonicalPage`` objects containing the groundtruth of the NER."""
 
-        return [p for p in self.children.pages if p.id in self.ner_gt_page_ids]
+        page_ids = set(self.ner_gt_page_ids)
+        return [p for p in self.children.pages if p.id in page_ids]
 
     @lazy_property
     def lemlink_gt_pages(self) -> List[vs.PageType]:
         """A list of ``CanonicalPage`` objects containing the groundtruth of the lemmatization."""
 
-        return [p for p in self.children.pages if p.id in self.lemlink_gt_page_ids]
+        page_ids = set(self.lemlink_gt_page_ids)
+        return [p for p in self.children.pages if p.id in page_ids]
 
 
     def get_duplicates(self):
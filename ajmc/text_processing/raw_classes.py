@@ -182,6 +182,11 @@ class RawCommentary(Commentary):
                                  section_types=section.section_types,
                                  section_title=section.section_title))
 
+        # We store each textcontainer's index, sparing ``CanonicalTextContainer.index`` a search through its list
+        for tcs in children.values():
+            for i, tc in enumerate(tcs):
+                tc.index = i
+
         # We now populate the children of the commentary
         can.children = LazyObject((lambda x: x), constrained_attrs=vs.CHILD_TYPES, **children)
 
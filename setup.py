@@ -159,6 +159,10 @@ setup(
             'detectron2 @ git+https://github.com/facebookresearch/detectron2.git@dc1b7d14331005eab9c6b67cbf0397d552793b3f',
             'pytest',
         ],
+        'json': [  # Faster canonical json (de)serialisation, and incremental parsing of very large ones
+            'orjson',
+            'ijson',
+        ],
         # "test": [""],
     },
     # If there are data files included in your packages that need to be
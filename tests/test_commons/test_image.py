@@ -1,7 +1,10 @@
+from types import SimpleNamespace
+
 import numpy as np
 import pytest
 
 from ajmc.commons import image as img
+from ajmc.commons import variables
 from ajmc.commons.geometry import Shape
 from tests import sample_objects as so
 
@@ -23,3 +26,57 @@ def test_remove_artifacts_from_contours(art_size):
 def test_ajmcimage():
     assert isinstance(so.sample_img.matrix, np.ndarray)
     assert isinstance(so.sample_img.crop(so.sample_bboxes['base']), img.AjmcImage)
+
+
+sample_boxes = [((10, 10), (50, 40)), ((100, 20), (180, 90)), ((30, 120), (250, 190))]
+
+
+@pytest.mark.parametrize('fill_opacity', [None, .3])
+@pytest.mark.parametrize('stroke_thickness', [1, 2])
+def test_draw_boxes(stroke_thickness, fill_opacity):
+    matrix = np.random.default_rng(0).integers(0, 256, (200, 300, 3), dtype=np.uint8)
+    color = (0, 128, 255)
+
+    expected = matrix.copy()
+    for box in sample_boxes:
+        expected = img.draw_box(box, expected, stroke_color=color, stroke_thickness=stroke_thickness,
+                                fill_color=color if fill_opacity else None, fill_opacity=fill_opacity or 1)
+
+    drawn = img.draw_boxes(sample_boxes, matrix.copy(), color=img.rgb_to_bgr(color),
+                           stroke_thickness=stroke_thickness, fill_opacity=fill_opacity)
+    assert np.array_equal(drawn, expected)
+
+
+def test_draw_textcontainers():
+    matrix = np.random.default_rng(0).integers(0, 256, (200, 300, 3), dtype=np.uint8)
+    tcs = [SimpleNamespace(type=type_, bbox=Shape(box)) for type_, box in zip(['word', 'line', 'word'], sample_boxes)]
+
+    expected = matrix.copy()
+    for tc in tcs:
+        color = variables.TEXTCONTAINERS_TYPES_TO_COLORS[tc.type]
+        expected = img.draw_box(tc.bbox.bbox, expected, stroke_color=color, fill_color=color, fill_opacity=.2)
+
+    drawn = img.draw_textcontainers(matrix.copy(), None, lambda tc: None, *tcs)
+    assert np.array_equal(drawn, expected)
+
+
+def test_draw_textcontainers_styles():
+    matrix = np.random.default_rng(0).integers(0, 256, (200, 300, 3), dtype=np.uint8)
+    region_type = next(iter(variables.REGION_TYPES_TO_COLORS))
+    tcs = [SimpleNamespace(type='region', region_type=region_type, bbox=Shape(sample_boxes[0])),
+           SimpleNamespace(type='entity', bboxes=[Shape(box) for box in sample_boxes[1:]]),
+           SimpleNamespace(type='word', bbox=Shape(((200, 10), (280, 60))))]
+
+    expected = matrix.copy()
+    color = variables.REGION_TYPES_TO_COLORS[region_type]
+    expected = img.draw_box(sample_boxes[0], expected, stroke_color=color, stroke_thickness=2,
+                            fill_color=color, fill_opacity=.3)
+    color = variables.TEXTCONTAINERS_TYPES_TO_COLORS['entity']
+    for box in sample_boxes[1:]:
+        expected = img.draw_box(box, expected, stroke_color=color, stroke_thickness=2,
+                                fill_color=color, fill_opacity=.3)
+    color = variables.TEXTCONTAINERS_TYPES_TO_COLORS['word']
+    expected = img.draw_box(((200, 10), (280, 60)), expected, stroke_color=color, fill_color=color, fill_opacity=.2)
+
+    drawn = img.draw_textcontainers(matrix.copy(), None, lambda tc: None, *tcs)
+    assert np.array_equal(drawn, expected)
@@ -10,6 +10,18 @@ def test_recursive_iterator():
     assert [i for i in iterator] == [0, 1, 2, 3, 4, 5]
 
 
+def test_timer():
+    calls = []
+
+    @misc.timer(iterations=2, number=3)
+    def func(x):
+        calls.append(x)
+        return x * 2
+
+    assert func(2) == 4
+    assert len(calls) == 6
+
+
 def test_split_list():
     assert misc.split_list([1, 2, 3, 4, 5], 2, pad=None) == [[1, 2], [3, 4], [5, None]]
 
@@ -7,3 +7,13 @@ def test_count_chars_by_charset():
     assert uu.count_chars_by_charset(string, 'greek') == 3
     assert uu.count_chars_by_charset(string, 'numeral') == 3
     assert uu.count_chars_by_charset(string, 'punctuation') == 3
+
+
+def test_get_codepoints_bounds():
+    assert uu.get_codepoints_bounds([0x41, 0x43, 0x42, 0x61]).tolist() == [0x41, 0x44, 0x61, 0x62]
+    assert uu.count_codepoints_within_bounds(uu.get_string_codepoints('ABCDab'), uu.get_codepoints_bounds([0x41, 0x42, 0x61])) == 3
+
+
+def test_charsets_ranges_are_merged():
+    for charset, ranges in uu.CHARSETS_RANGES.items():
+        assert len(uu.CHARSETS_BOUNDS_NFC[charset]) == 2 * len(ranges)
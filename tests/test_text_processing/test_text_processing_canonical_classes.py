@@ -1,7 +1,11 @@
+import json
+import random
+
 import pytest
 from lazy_objects.lazy_objects import LazyObject
 
 from ajmc.commons import variables as vs
+from ajmc.commons.arithmetic import is_interval_within_interval
 from ajmc.text_processing import canonical_classes as cc
 from tests import sample_objects as so
 
@@ -45,3 +49,121 @@ def test_canonical_textcontainer(tc):
         parent = getattr(tc.parents, parent_type)
         if parent is not None:
             assert tc in getattr(parent.children, vs.TC_TYPES_TO_CHILD_TYPES[tc.type])
+
+
+@pytest.mark.parametrize('commentary', [so.sample_can_commentary,
+                                        so.sample_cancommentary_from_json])
+def test_words_bboxes(commentary):
+    words = commentary.children.words
+    assert commentary.words_bboxes.tolist() == [[*w.bbox.bbox[0], *w.bbox.bbox[1]] for w in words]
+
+    # The array is rebuilt when the words list is resized
+    last_word = words.pop()
+    try:
+        assert len(commentary.words_bboxes) == len(words)
+    finally:
+        words.append(last_word)
+    assert len(commentary.words_bboxes) == len(words)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 1000])
+def test_canonical_commentary_to_json(tmp_path, monkeypatch, chunk_size):
+    monkeypatch.setattr(cc, 'USE_ORJSON', False)
+    monkeypatch.setattr(cc, 'JSON_DUMP_CHUNK_SIZE', chunk_size)
+    commentary = so.sample_can_commentary
+
+    expected = {'id': commentary.id,
+                'metadata': commentary.metadata,
+                'ocr_gt_page_ids': commentary.ocr_gt_page_ids,
+                'olr_gt_page_ids': commentary.olr_gt_page_ids,
+                'ner_gt_page_ids': commentary.ner_gt_page_ids,
+                'lem_link_gt_page_ids': commentary.lemlink_gt_page_ids,
+                'children': {child_type: [tc.to_json() for tc in getattr(commentary.children, child_type)]
+                             for child_type in vs.CHILD_TYPES}}
+
+    commentary.to_json(tmp_path / 'commentary.json')
+    assert (tmp_path / 'commentary.json').read_text(encoding='utf-8') == json.dumps(expected, indent=2,
+                                                                                    ensure_ascii=False)
+
+
+def test_canonical_commentary_to_json_failure(tmp_path, monkeypatch):
+    def raise_error(self):
+        raise RuntimeError
+
+    (tmp_path / 'commentary.json').write_text('{}', encoding='utf-8')
+    monkeypatch.setattr(cc.CanonicalWord, 'to_json', raise_error)
+
+    with pytest.raises(RuntimeError):
+        so.sample_can_commentary.to_json(tmp_path / 'commentary.json')
+    assert (tmp_path / 'commentary.json').read_text(encoding='utf-8') == '{}'
+    assert list(tmp_path.iterdir()) == [tmp_path / 'commentary.json']
+
+
+def test_iter_canonical_json(tmp_path):
+    pytest.importorskip('ijson')
+    can_json = {'id': 'commentary',
+                'dotted.key': {'nested.key': [1, {'a': None}], 'empty': []},
+                'children': {'pages': [{'id': 'page', 'word_range': [0, 1]}],
+                             'lines': [],
+                             'words': [{'bbox': [[0, 0], [1, 1.5]], 'text': 'λόγος'}, {'bbox': [[1, 1], [2, 2]], 'text': ''}]}}
+    (tmp_path / 'commentary.json').write_text(json.dumps(can_json, indent=2, ensure_ascii=False), encoding='utf-8')
+
+    assert list(cc.iter_canonical_json(tmp_path / 'commentary.json')) == list(cc.iter_loaded_canonical_json(can_json))
+
+
+def test_canonical_commentary_from_json_streaming(tmp_path, monkeypatch):
+    pytest.importorskip('ijson')
+    cc.CanonicalCommentary.from_json(so.sample_canonical_path).to_json(tmp_path / 'loaded.json')
+    monkeypatch.setattr(cc, 'STREAMING_MIN_FILE_SIZE', 0)
+    cc.CanonicalCommentary.from_json(so.sample_canonical_path).to_json(tmp_path / 'streamed.json')
+
+    assert (tmp_path / 'streamed.json').read_bytes() == (tmp_path / 'loaded.json').read_bytes()
+
+
+
+def test_canonical_commentary_from_json_sorted_keys(tmp_path, monkeypatch):
+    """Jsons with ``children`` before the other top-level fields must load the same when streamed."""
+    pytest.importorskip('ijson')
+    can_json = json.loads(so.sample_canonical_path.read_text(encoding='utf-8'))
+    (tmp_path / 'sorted.json').write_text(json.dumps(can_json, sort_keys=True), encoding='utf-8')
+
+    cc.CanonicalCommentary.from_json(tmp_path / 'sorted.json').to_json(tmp_path / 'loaded.json')
+    monkeypatch.setattr(cc, 'STREAMING_MIN_FILE_SIZE', 0)
+    cc.CanonicalCommentary.from_json(tmp_path / 'sorted.json').to_json(tmp_path / 'streamed.json')
+
+    assert (tmp_path / 'streamed.json').read_bytes() == (tmp_path / 'loaded.json').read_bytes()
+
+def test_canonical_family_lookups():
+    """Checks ``_get_children`` and ``_get_parent`` against a brute-force scan, on unsorted, overlapping, duplicate and
+    empty word ranges."""
+    commentary = cc.CanonicalCommentary(id='commentary', children=None, images=[])
+    word_ranges = [(0, 9), (0, 4), (5, 9), (5, 9), (3, 7), (2, 2), (8, 12), (0, 0), (10, 9), (4, 3), (13, 12)]
+    types_to_kwargs = {'section': {'section_types': ['commentary'], 'section_title': 'title'},
+                       'page': {},
+                       'region': {'region_type': 'commentary'},
+                       'line': {}}
+
+    rng = random.Random(0)
+    children = {child_type: [] for child_type in vs.CHILD_TYPES}
+    children['words'] = [cc.CanonicalWord(text='word', bbox=((0, 0), (1, 1)), commentary=commentary, index=i)
+                         for i in range(13)]
+    for tc_type, kwargs in types_to_kwargs.items():
+        rng.shuffle(word_ranges)
+        for i, word_range in enumerate(word_ranges):
+            tc_kwargs = {'id': f'page_{i}'} if tc_type == 'page' else kwargs
+            children[vs.TC_TYPES_TO_CHILD_TYPES[tc_type]].append(
+                cc.get_tc_type_class(tc_type)(commentary=commentary, word_range=word_range, index=i, **tc_kwargs))
+    commentary.children = LazyObject(compute_function=lambda x: x, constrained_attrs=vs.CHILD_TYPES, **children)
+
+    for tc in [tc for tc_type in types_to_kwargs for tc in children[vs.TC_TYPES_TO_CHILD_TYPES[tc_type]]]:
+        for tc_type in types_to_kwargs:
+            expected = [c for c in children[vs.TC_TYPES_TO_CHILD_TYPES[tc_type]]
+                        if is_interval_within_interval(contained=c.word_range, container=tc.word_range) and c.id != tc.id]
+            assert tc._get_children(vs.TC_TYPES_TO_CHILD_TYPES[tc_type]) == expected
+
+    for tc in [tc for tcs in children.values() for tc in tcs]:
+        for tc_type in types_to_kwargs:
+            expected = next((c for c in children[vs.TC_TYPES_TO_CHILD_TYPES[tc_type]]
+                             if is_interval_within_interval(contained=tc.word_range, container=c.word_range)
+                             and c.id != tc.id), None)
+            assert tc._get_parent(tc_type) is expected